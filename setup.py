@@ -77,7 +77,14 @@ setup(
         # eg: 'keyword1', 'keyword2', 'keyword3',
     ],
     python_requires=">=3.7",
-    install_requires=["pandas", "blinker", "dill", "networkx", "oemof.tools"],
+    install_requires=[
+        "pandas",
+        "blinker",
+        "dill",
+        "networkx",
+        "numpy",
+        "oemof.tools",
+    ],
     extras_require={
         "dev": ["pytest"],
         # eg:
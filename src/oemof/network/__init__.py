@@ -1,17 +1,13 @@
 __version__ = "0.5.0a1"
 
-from . import energy_system
-from . import graph
-from . import groupings
-from . import network
-from .network import Bus
-from .network import Component
-from .network import Edge
-from .network import Entity
-from .network import Node
-from .network import Sink
-from .network import Source
-from .network import Transformer
+from importlib import import_module as _import_module
+
+_submodules = [
+    "energy_system",
+    "graph",
+    "groupings",
+    "network",
+]
 
 __all__ = [
     "Bus",
@@ -27,3 +23,19 @@ __all__ = [
     "Source",
     "Transformer",
 ]
+
+
+def __getattr__(name):
+    """Import submodules and classes only when they are first accessed."""
+    if name in _submodules:
+        attribute = _import_module("." + name, __name__)
+    elif name in __all__:
+        attribute = getattr(_import_module(".network", __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = attribute
+    return attribute
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -18,15 +18,14 @@ SPDX-License-Identifier: MIT
 import logging
 import os
 import warnings
-from collections import deque
 
 import blinker
-import dill as pickle
 from oemof.tools import debugging
 
 from oemof.network.groupings import DEFAULT as BY_UID
 from oemof.network.groupings import Entities
 from oemof.network.groupings import Grouping
+from oemof.network.network.helpers import Outputs
 
 
 class EnergySystem:
@@ -138,6 +137,19 @@ class EnergySystem:
     .. _blinker: https://blinker.readthedocs.io/en/stable/
     """
 
+    # Attributes holding data derived from the nodes. They are left out of
+    # dumps and reset on `restore`.
+    _caches = [
+        "_flows",
+        "_flows_version",
+        "_adjacency",
+        "_adjacency_version",
+    ]
+
+    # Like `Outputs.version`, incremented whenever the nodes of any energy
+    # system might change, including via the dictionary returned by `node`.
+    _nodes_version = 0
+
     def __init__(
         self,
         *,
@@ -163,10 +175,14 @@ class EnergySystem:
 
         self._first_ungrouped_node_index_ = 0
         self._groups = {}
-        self._groupings = [BY_UID] + [
+        self._groupings = (BY_UID,) + tuple(
             g if isinstance(g, Grouping) else Entities(g) for g in groupings
-        ]
+        )
         self._nodes = {}
+        self._flows = None
+        self._flows_version = None
+        self._adjacency = None
+        self._adjacency_version = None
 
         self.results = results
         self.timeindex = timeindex
@@ -177,22 +193,23 @@ class EnergySystem:
     def add(self, *nodes):
         """Add :class:`nodes <oemof.network.Node>` to this energy system."""
         self._nodes.update({node.label: node for node in nodes})
-        for n in nodes:
-            self.signals[type(self).add].send(n, EnergySystem=self)
+        EnergySystem._nodes_version += 1
+        signal = self.signals[type(self).add]
+        # Don't send a signal per node if nobody is listening.
+        if signal.receivers:
+            for n in nodes:
+                signal.send(n, EnergySystem=self)
 
     signals[add] = blinker.signal(add)
 
     @property
     def groups(self):
         gs = self._groups
-        deque(
-            (
+        groupings = self._groupings
+        new_nodes = list(self.nodes)[self._first_ungrouped_node_index_ :]
+        for g in groupings:
+            for n in new_nodes:
                 g(n, gs)
-                for g in self._groupings
-                for n in list(self.nodes)[self._first_ungrouped_node_index_ :]
-            ),
-            maxlen=0,
-        )
         self._first_ungrouped_node_index_ = len(self.nodes)
         return self._groups
 
@@ -203,6 +220,8 @@ class EnergySystem:
             " and might change without prior notice."
         )
         warnings.warn(msg, debugging.ExperimentalFeatureWarning)
+        # The dictionary may be modified by the caller.
+        EnergySystem._nodes_version += 1
         return self._nodes
 
     @property
@@ -210,26 +229,62 @@ class EnergySystem:
         return self._nodes.values()
 
     def flows(self):
-        return {
-            (source, target): source.outputs[target]
-            for source in self.nodes
-            for target in source.outputs
-        }
+        """Map `(source, target)` node pairs to the edge connecting them.
+
+        The pairs are cached until nodes are added or removed or any node's
+        inputs or outputs are modified, but every call returns a new
+        dictionary.
+        """
+        version = self._cache_version()
+        if self._flows is None or self._flows_version != version:
+            self._flows = {
+                (source, target): source.outputs[target]
+                for source in self.nodes
+                for target in source.outputs
+            }
+            self._flows_version = version
+        return dict(self._flows)
+
+    def compile_adjacency(self):
+        """Flatten the edges between this energy system's nodes into arrays.
+
+        Returns a :class:`~oemof.network.graph.Adjacency`, which is cached the
+        same way as :meth:`flows`.
+        """
+        version = self._cache_version()
+        if self._adjacency is None or self._adjacency_version != version:
+            from oemof.network.graph import Adjacency
+
+            self._adjacency = Adjacency(self.nodes)
+            self._adjacency_version = version
+        return self._adjacency
+
+    def _cache_version(self):
+        """Identify the state of the graph the caches were built from.
+
+        The number of nodes catches changes made via a dictionary obtained
+        from `node` before the cache was built.
+        """
+        return (Outputs.version, EnergySystem._nodes_version, len(self._nodes))
 
     def dump(self, dpath=None, filename=None):
         r"""Dump an EnergySystem instance."""
+        import dill as pickle
+
         if dpath is None:
-            bpath = os.path.join(os.path.expanduser("~"), ".oemof")
-            if not os.path.isdir(bpath):
-                os.mkdir(bpath)
-            dpath = os.path.join(bpath, "dumps")
-            if not os.path.isdir(dpath):
-                os.mkdir(dpath)
+            dpath = os.path.join(os.path.expanduser("~"), ".oemof", "dumps")
+            os.makedirs(dpath, exist_ok=True)
 
         if filename is None:
             filename = "es_dump.oemof"
 
-        pickle.dump(self.__dict__, open(os.path.join(dpath, filename), "wb"))
+        attributes = {
+            name: value
+            for name, value in self.__dict__.items()
+            if name not in self._caches
+        }
+        with open(os.path.join(dpath, filename), "wb") as f:
+            pickle.dump(attributes, f, protocol=pickle.HIGHEST_PROTOCOL)
 
         msg = "Attributes dumped to: {0}".format(os.path.join(dpath, filename))
         logging.debug(msg)
@@ -237,6 +292,8 @@ class EnergySystem:
 
     def restore(self, dpath=None, filename=None):
         r"""Restore an EnergySystem instance."""
+        import dill as pickle
+
         logging.info(
             "Restoring attributes will overwrite existing attributes."
         )
@@ -246,7 +303,10 @@ class EnergySystem:
         if filename is None:
             filename = "es_dump.oemof"
 
-        self.__dict__ = pickle.load(open(os.path.join(dpath, filename), "rb"))
+        with open(os.path.join(dpath, filename), "rb") as f:
+            self.__dict__ = pickle.load(f)
+        for name in self._caches:
+            setattr(self, name, None)
 
         msg = "Attributes restored from: {0}".format(
             os.path.join(dpath, filename)
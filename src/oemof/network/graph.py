@@ -12,10 +12,6 @@ SPDX-FileCopyrightText: Uwe Krien <krien@uni-bremen.de>
 SPDX-License-Identifier: MIT
 """
 
-import warnings
-
-import networkx as nx
-
 
 def create_nx_graph(
     energy_system=None,
@@ -48,11 +44,12 @@ def create_nx_graph(
     Examples
     --------
     >>> import os
+    >>> import networkx as nx
     >>> import pandas as pd
     >>> from oemof.network.network import Node
     >>> from oemof.network.energy_system import EnergySystem
     >>> import oemof.network.graph as grph
-    >>> datetimeindex = pd.date_range('1/1/2017', periods=3, freq='H')
+    >>> datetimeindex = pd.date_range('1/1/2017', periods=3, freq='h')
     >>> es = EnergySystem(timeindex=datetimeindex)
     >>> b_gas = Node(label='b_gas')
     >>> bel1 = Node(label='bel1')
@@ -95,52 +92,101 @@ def create_nx_graph(
     Needs graphviz and networkx (>= v.1.11) to work properly.
     Tested on Ubuntu 16.04 x64 and solydxk (debian 9).
     """
-    with warnings.catch_warnings():
-        # suppress ExperimentalFeatureWarnungs
-        warnings.simplefilter("ignore")
-
-        # construct graph from nodes and flows
-        grph = nx.DiGraph()
-
-        # add nodes
-        for label in energy_system.node.keys():
-            grph.add_node(str(label), label=str(label))
-
-        # add labeled flows on directed edge if an optimization_model has been
-        # passed or undirected edge otherwise
-        for n in energy_system.nodes:
-            for i in n.inputs.keys():
-                weight = getattr(
-                    energy_system.flows()[(i, n)], "nominal_value", None
-                )
-                if weight is None:
-                    grph.add_edge(str(i.label), str(n.label))
-                else:
-                    grph.add_edge(
-                        str(i.label),
-                        str(n.label),
-                        weigth=format(weight, ".2f"),
-                    )
-
-        # remove nodes and edges based on precise labels
-        if remove_nodes is not None:
-            grph.remove_nodes_from(remove_nodes)
-        if remove_edges is not None:
-            grph.remove_edges_from(remove_edges)
-
-        # remove nodes based on substrings
-        if remove_nodes_with_substrings is not None:
-            for i in remove_nodes_with_substrings:
-                remove_nodes = [
-                    str(label)
-                    for label in energy_system.node.keys()
-                    if i in str(label)
-                ]
-                grph.remove_nodes_from(remove_nodes)
-
-        if filename is not None:
-            if filename[-8:] != ".graphml":
-                filename = filename + ".graphml"
-            nx.write_graphml(grph, filename)
-
-        return grph
+    import networkx as nx
+
+    # construct graph from nodes and flows
+    grph = nx.DiGraph()
+
+    labels = {n: str(n.label) for n in energy_system.nodes}
+
+    # collect nodes and labeled flows on directed edges in a single pass
+    # and hand them over to the graph in bulk
+    # (edges with equal weights share their attribute dictionary, as
+    # networkx copies the attributes into its own per edge dictionary)
+    nodes = []
+    edges = []
+    weights = {}
+    for n, n_label in labels.items():
+        nodes.append((n_label, {"label": n_label}))
+        for i in n.inputs.keys():
+            weight = getattr(i.outputs[n], "nominal_value", None)
+            if weight is None:
+                edges.append((labels[i], n_label))
+            else:
+                weight = f"{weight:.2f}"
+                attributes = weights.get(weight)
+                if attributes is None:
+                    attributes = weights[weight] = {"weight": weight}
+                edges.append((labels[i], n_label, attributes))
+    grph.add_nodes_from(nodes)
+    grph.add_edges_from(edges)
+
+    # remove nodes and edges based on precise labels
+    if remove_nodes is not None:
+        grph.remove_nodes_from(remove_nodes)
+    if remove_edges is not None:
+        grph.remove_edges_from(remove_edges)
+
+    # remove nodes based on substrings
+    if remove_nodes_with_substrings is not None:
+        substrings = tuple(remove_nodes_with_substrings)
+        grph.remove_nodes_from(
+            label
+            for label in labels.values()
+            if any(s in label for s in substrings)
+        )
+
+    if filename is not None:
+        if filename[-8:] != ".graphml":
+            filename = filename + ".graphml"
+        nx.write_graphml(grph, filename)
+
+    return grph
+
+
+class Adjacency:
+    """Compressed sparse row view of the edges between a set of nodes.
+
+    Every node is identified by its integer position, its `iloc`, in
+    `nodes`. The outputs of the node at position `i` are stored in
+    `targets[indptr[i] : indptr[i + 1]]`, sorted by `iloc`, and the edges
+    leading to them at the same positions in `edges`. For loops over all
+    edges, `sources` holds the `iloc` of every edge's input node, so that
+    `zip(sources, targets, edges)` visits each edge once. Edges to nodes
+    which are not part of `nodes` are left out.
+
+    Parameters
+    ----------
+    nodes : iterable of :class:`oemof.network.Node`
+        The nodes to flatten.
+    """
+
+    def __init__(self, nodes):
+        import numpy as np
+
+        nodes = list(nodes)
+        self.ilocs = {n: i for i, n in enumerate(nodes)}
+        self.nodes = np.empty(len(nodes), dtype=object)
+        self.nodes[:] = nodes
+        self.indptr = np.zeros(len(nodes) + 1, dtype=np.intp)
+        neighbors = []
+        edges = []
+        for i, node in enumerate(nodes):
+            row = sorted(
+                (self.ilocs[target], edge)
+                for target, edge in node.outputs.items()
+                if target in self.ilocs
+            )
+            neighbors.extend(iloc for iloc, _ in row)
+            edges.extend(edge for _, edge in row)
+            self.indptr[i + 1] = len(neighbors)
+        self.sources = np.repeat(
+            np.arange(len(nodes), dtype=np.intp), np.diff(self.indptr)
+        )
+        self.targets = np.array(neighbors, dtype=np.intp)
+        self.edges = np.empty(len(edges), dtype=object)
+        self.edges[:] = edges
+
+    def neighbors(self, iloc):
+        """Return the `ilocs` of the outputs of the node at `iloc`."""
+        return self.targets[self.indptr[iloc] : self.indptr[iloc + 1]]
@@ -17,10 +17,37 @@ from collections.abc import Hashable
 from collections.abc import Iterable
 from collections.abc import Mapping
 from collections.abc import MutableMapping
-from itertools import chain
 from itertools import filterfalse
 
 from oemof.network.network.edge import Edge
+from oemof.network.network.helpers import _kind_by_type
+
+# How `Grouping.__call__` filters groups and whether keys are collections of
+# group keys, cached by type.
+_MUTABLE_MAPPING, _MAPPING, _ITERABLE, _SINGLE = (
+    "mutable mapping",
+    "mapping",
+    "iterable",
+    "single",
+)
+_group_kinds = {}
+_key_collections = {}
+
+
+def _classify_group(group):
+    if isinstance(group, MutableMapping):
+        return _MUTABLE_MAPPING
+    elif isinstance(group, Mapping):
+        return _MAPPING
+    elif isinstance(group, Iterable):
+        return _ITERABLE
+    else:
+        return _SINGLE
+
+
+def _is_key_collection(key):
+    return isinstance(key, Iterable) and not isinstance(key, Hashable)
+
 
 # TODO: Update docstrings.
 #
@@ -216,22 +243,20 @@ class Grouping:
         if k is None:
             return
         v = self.value(e)
-        if isinstance(v, MutableMapping):
+        kind = _kind_by_type(_group_kinds, v, _classify_group)
+        if kind is _MUTABLE_MAPPING:
             for k in list(filterfalse(self.filter, v)):
                 v.pop(k)
-        elif isinstance(v, Mapping):
+        elif kind is _MAPPING:
             v = type(v)(dict((k, v[k]) for k in filter(self.filter, v)))
-        elif isinstance(v, Iterable):
+        elif kind is _ITERABLE:
             v = type(v)(filter(self.filter, v))
         elif self.filter and not self.filter(v):
             return
         if not v:
             return
-        for group in (
-            k
-            if (isinstance(k, Iterable) and not isinstance(k, Hashable))
-            else [k]
-        ):
+        is_collection = _kind_by_type(_key_collections, k, _is_key_collection)
+        for group in k if is_collection else [k]:
             d[group] = self.merge(v, d[group]) if group in d else v
 
 
@@ -273,11 +298,11 @@ class Flows(Entities):
         return set(flows)
 
     def __call__(self, n, d):
-        flows = (
-            {n}
-            if isinstance(n, Edge)
-            else set(chain(n.outputs.values(), n.inputs.values()))
-        )
+        if isinstance(n, Edge):
+            flows = {n}
+        else:
+            flows = set(n.outputs.values())
+            flows.update(n.inputs.values())
         super().__call__(flows, d)
 
 
@@ -298,16 +323,11 @@ class FlowsWithNodes(Entities):
         return set(tuples)
 
     def __call__(self, n, d):
-        tuples = (
-            {(n.input, n.output, n)}
-            if isinstance(n, Edge)
-            else set(
-                chain(
-                    ((n, t, f) for (t, f) in n.outputs.items()),
-                    ((s, n, f) for (s, f) in n.inputs.items()),
-                )
-            )
-        )
+        if isinstance(n, Edge):
+            tuples = {(n.input, n.output, n)}
+        else:
+            tuples = {(n, t, f) for (t, f) in n.outputs.items()}
+            tuples.update((s, n, f) for (s, f) in n.inputs.items())
         super().__call__(tuples, d)
 
 
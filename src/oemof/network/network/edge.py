@@ -16,6 +16,25 @@ from collections import namedtuple
 from collections.abc import Mapping
 
 from .entity import Entity
+from .helpers import _kind_by_type
+
+# How `Edge.from_object` treats objects, cached by their type.
+_EDGE, _MAPPING, _VALUES = "edge", "mapping", "values"
+_object_kinds = {}
+
+
+def _classify_object(o):
+    if isinstance(o, Edge):
+        return _EDGE
+    elif isinstance(o, Mapping):
+        return _MAPPING
+    else:
+        return _VALUES
+
+
+def _object_kind(o):
+    """Tell whether `o` is an `Edge`, a `Mapping` or plain values."""
+    return _kind_by_type(_object_kinds, o, _classify_object)
 
 
 class Edge(Entity):
@@ -39,6 +58,8 @@ class Edge(Entity):
     name.
     """
 
+    __slots__ = ["values"]
+
     Label = namedtuple("EdgeLabel", ["input", "output"])
 
     def __init__(
@@ -80,13 +101,31 @@ class Edge(Entity):
           * In all other cases, `o` will be used as the `values` keyword
             argument to `Edge`'s constructor.
         """
-        if isinstance(o, Edge):
+        kind = _object_kind(o)
+        if kind is _EDGE:
             return o
-        elif isinstance(o, Mapping):
+        elif kind is _MAPPING:
             return cls(**o)
         else:
             return Edge(values=o)
 
+    def _set_endpoints(self, input_node, output_node):
+        """Set `input` and `output` at once.
+
+        Like setting both attributes one after the other, the edge is
+        registered with its nodes if it had been missing an endpoint before,
+        but the label is only rebuilt once.
+        """
+        old_label = self._label
+        self._label = Edge.Label(input_node, output_node)
+        self._str = None
+        if (
+            (old_label.input is None or old_label.output is None)
+            and input_node is not None
+            and output_node is not None
+        ):
+            input_node.outputs[output_node] = self
+
     @property
     def flow(self):
         return self.values
@@ -97,22 +136,24 @@ class Edge(Entity):
 
     @property
     def input(self):
-        return self.label.input
+        return self._label.input
 
     @input.setter
     def input(self, i):
-        old_input = self.input
-        self._label = Edge.Label(i, self.label.output)
-        if old_input is None and i is not None and self.output is not None:
-            i.outputs[self.output] = self
+        old_input, output = self._label
+        self._label = Edge.Label(i, output)
+        self._str = None
+        if old_input is None and i is not None and output is not None:
+            i.outputs[output] = self
 
     @property
     def output(self):
-        return self.label.output
+        return self._label.output
 
     @output.setter
     def output(self, o):
-        old_output = self.output
-        self._label = Edge.Label(self.label.input, o)
-        if old_output is None and o is not None and self.input is not None:
-            o.inputs[self.input] = self
+        input_, old_output = self._label
+        self._label = Edge.Label(input_, o)
+        self._str = None
+        if old_output is None and o is not None and input_ is not None:
+            o.inputs[input_] = self
@@ -12,10 +12,7 @@ SPDX-FileCopyrightText: Patrik Schönfeldt <patrik.schoenfeldt@dlr.de>
 SPDX-License-Identifier: MIT
 """
 
-from functools import total_ordering
 
-
-@total_ordering
 class Entity:
     """Represents an Entity in an energy system graph.
 
@@ -44,8 +41,12 @@ class Entity:
         to easily attach custom information to any Entity.
     """
 
+    __slots__ = ["_label", "_str", "custom_properties", "__weakref__"]
+
     def __init__(self, label, *, custom_properties=None):
         self._label = label
+        # Cache for `str(self)`, which has to be reset when the label changes.
+        self._str = None
         if custom_properties is None:
             custom_properties = {}
         self.custom_properties = custom_properties
@@ -56,18 +57,36 @@ class Entity:
     def __lt__(self, other):
         return str(self) < str(other)
 
-    def __hash__(self):
-        return hash(self.label)
+    def __le__(self, other):
+        return str(self) <= str(other)
+
+    def __gt__(self, other):
+        return str(self) > str(other)
+
+    def __ge__(self, other):
+        return str(self) >= str(other)
+
+    # Entities are only equal to themselves, so hashing them by identity is
+    # consistent with `__eq__`. Contrary to hashing the label, this does not
+    # change when an `Edge`'s label is updated and it is already available
+    # while unpickling, before the label has been restored.
+    __hash__ = object.__hash__
 
     def __str__(self):
-        return str(self.label)
+        string = self._str
+        if string is None:
+            string = self._str = str(self.label)
+        return string
 
     def __repr__(self):
-        return repr(
-            "<{0.__module__}.{0.__name__}: {1!r}>".format(
-                type(self), self.label
-            )
-        )
+        cls = type(self)
+        # Cached per class, so it has to be looked up in the class' own
+        # namespace instead of being inherited.
+        prefix = cls.__dict__.get("_repr_prefix")
+        if prefix is None:
+            prefix = f"<{cls.__module__}.{cls.__name__}: "
+            cls._repr_prefix = prefix
+        return repr(f"{prefix}{self.label!r}>")
 
     @property
     def label(self):
@@ -15,14 +15,46 @@ from collections import UserDict
 from collections.abc import MutableMapping
 
 
+def _kind_by_type(cache, obj, classify):
+    """Return `classify(obj)`, cached in `cache` by the type of `obj`.
+
+    Only suitable for classifications depending on nothing but the type, like
+    `isinstance` checks against abstract base classes, for which a lookup by
+    `type(obj)` is considerably cheaper.
+    """
+    kind = cache.get(type(obj))
+    if kind is None:
+        kind = cache[type(obj)] = classify(obj)
+    return kind
+
+
 class Inputs(MutableMapping):
     """A special helper to map `n1.inputs[n2]` to `n2.outputs[n1]`."""
 
+    __slots__ = ["target"]
+
     def __init__(self, target):
         self.target = target
 
     def __getitem__(self, key):
-        return key.outputs.__getitem__(self.target)
+        return self.target._in_edges[key]
+
+    # Like for `Outputs`, read access uses the target's `_in_edges` directly.
+
+    def __contains__(self, key):
+        return key in self.target._in_edges
+
+    def get(self, key, default=None):
+        return self.target._in_edges.get(key, default)
+
+    def keys(self):
+        return self.target._in_edges.keys()
+
+    def items(self):
+        return self.target._in_edges.items()
+
+    def values(self):
+        return self.target._in_edges.values()
 
     def __delitem__(self, key):
         return key.outputs.__delitem__(self.target)
@@ -34,14 +66,12 @@ class Inputs(MutableMapping):
         return iter(self.target._in_edges)
 
     def __len__(self):
-        return self.target._in_edges.__len__()
+        return len(self.target._in_edges)
 
     def __repr__(self):
-        return repr(
-            "<{0.__module__}.{0.__name__}: {1!r}>".format(
-                type(self), dict(self)
-            )
-        )
+        cls = type(self)
+        edges = self.target._in_edges
+        return repr(f"<{cls.__module__}.{cls.__name__}: {edges!r}>")
 
 
 class Outputs(UserDict):
@@ -49,14 +79,41 @@ class Outputs(UserDict):
     Helper that intercepts modifications to update `Inputs` symmetrically.
     """
 
+    version = 0
+    """Incremented on every modification of any `Outputs` instance.
+
+    Allows caches derived from the edges of an energy system to notice that
+    they are outdated.
+    """
+
     def __init__(self, source):
         self.source = source
         super().__init__()
 
+    # Read access goes straight to the underlying dictionary. Only
+    # modifications need to be intercepted.
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+
+    def keys(self):
+        return self.data.keys()
+
+    def items(self):
+        return self.data.items()
+
+    def values(self):
+        return self.data.values()
+
     def __delitem__(self, key):
-        key._in_edges.remove(self.source)
+        del key._in_edges[self.source]
+        Outputs.version += 1
         return super().__delitem__(key)
 
     def __setitem__(self, key, value):
-        key._in_edges.add(self.source)
+        key._in_edges[self.source] = value
+        Outputs.version += 1
         return super().__setitem__(key, value)
@@ -12,12 +12,20 @@ SPDX-License-Identifier: MIT
 """
 
 import warnings
+from collections.abc import Collection
+from types import MappingProxyType
 
+from .edge import _VALUES
 from .edge import Edge
+from .edge import _object_kind
 from .entity import Entity
 from .helpers import Inputs
 from .helpers import Outputs
 
+# Shared stand-ins for omitted inputs or outputs and for missing flows.
+_EMPTY = ()
+_NO_FLOWS = MappingProxyType({})
+
 
 class Node(Entity):
     r"""A Node of an energy system graph.
@@ -25,14 +33,16 @@ class Node(Entity):
     Parameters
     ----------
     label : (See documentation of class `Entity`)
-    inputs: list or dict, optional
-        Either a list of this nodes' input nodes or a dictionary mapping input
-        nodes to corresponding inflows (i.e. input values).
-        List will be converted to dictionary with values set to None.
-    outputs: list or dict, optional
-        Either a list of this nodes' output nodes or a dictionary mapping
+    inputs: iterable or dict, optional
+        Either an iterable of this nodes' input nodes or a dictionary mapping
+        input nodes to corresponding inflows (i.e. input values).
+        Input nodes given without a dictionary get connected via an empty
+        :class:`Edge`, just like ones mapped to None.
+    outputs: iterable or dict, optional
+        Either an iterable of this nodes' output nodes or a dictionary mapping
         output nodes to corresponding outflows (i.e. output values).
-        List will be converted to dictionary with values set to None.
+        Output nodes given without a dictionary get connected via an empty
+        :class:`Edge`, just like ones mapped to None.
 
     Attributes
     ----------
@@ -42,6 +52,8 @@ class Node(Entity):
         A dictionary mapping output nodes to corresponding outflows.
     """
 
+    __slots__ = ["_inputs", "_outputs", "_in_edges"]
+
     def __init__(
         self,
         label,
@@ -52,38 +64,37 @@ class Node(Entity):
     ):
         super().__init__(label=label, custom_properties=custom_properties)
 
-        self._inputs = Inputs(self)
-        self._outputs = Outputs(self)
-        self._in_edges = set()
+        # `Inputs` and `Outputs` are only created when first needed.
+        self._inputs = None
+        self._outputs = None
+        # Mirrors the `Outputs` of input nodes, mapping them to their edges.
+        self._in_edges = {}
+
+        if inputs is None and outputs is None:
+            return
 
+        # Anything with a `get` method provides flows, other iterables are
+        # turned into lists, so they can be iterated more than once.
         if inputs is None:
-            inputs = {}
+            inputs = _EMPTY
+        elif not (hasattr(inputs, "get") or isinstance(inputs, Collection)):
+            inputs = list(inputs)
         if outputs is None:
-            outputs = {}
+            outputs = _EMPTY
+        elif not (hasattr(outputs, "get") or isinstance(outputs, Collection)):
+            outputs = list(outputs)
 
-        msg = "{} {!r} of {!r} not an instance of Node but of {}."
+        # Check everything up front, so that no other node gets connected to
+        # this one if the construction fails.
+        _check_nodes("Input", inputs, self)
+        _check_nodes("Output", outputs, self)
 
+        flows = inputs if hasattr(inputs, "get") else _NO_FLOWS
         for i in inputs:
-            if not isinstance(i, Node):
-                raise ValueError(msg.format("Input", i, self, type(i)))
-            self._in_edges.add(i)
-            try:
-                flow = inputs.get(i)
-            except AttributeError:
-                flow = None
-            edge = Edge.from_object(flow)
-            edge.input = i
-            edge.output = self
+            _connect(i, self, flows.get(i))
+        flows = outputs if hasattr(outputs, "get") else _NO_FLOWS
         for o in outputs:
-            if not isinstance(o, Node):
-                raise ValueError(msg.format("Output", o, self, type(o)))
-            try:
-                flow = outputs.get(o)
-            except AttributeError:
-                flow = None
-            edge = Edge.from_object(flow)
-            edge.input = self
-            edge.output = o
+            _connect(self, o, flows.get(o))
 
     @property
     def inputs(self):
@@ -93,6 +104,8 @@ class Node(Entity):
         If :obj:`self` is an :class:`Edge`, returns a dict containing the
         :class:`Edge`'s single input node as the key and the flow as the value.
         """
+        if self._inputs is None:
+            self._inputs = Inputs(self)
         return self._inputs
 
     @property
@@ -104,42 +117,69 @@ class Node(Entity):
         :class:`Edge`'s single output node as the key and the flow as the
         value.
         """
+        if self._outputs is None:
+            self._outputs = Outputs(self)
         return self._outputs
 
 
+def _check_nodes(kind, nodes, node):
+    """Raise a `ValueError` if not all `nodes` are instances of `Node`."""
+    for n in nodes:
+        if not isinstance(n, Node):
+            raise ValueError(
+                f"{kind} {n!r} of {node!r} not an instance of Node but of"
+                f" {type(n)}."
+            )
+
+
+def _connect(source, target, flow):
+    """Connect `source` to `target` via an `Edge` created from `flow`.
+
+    Plain values are passed to the constructor of a new `Edge` together with
+    both nodes and existing edges get both endpoints set at once, so the edge
+    gets registered with `source` and `target` in a single step instead of
+    via `Edge.input` and `Edge.output` one after the other.
+    """
+    if flow is None:
+        Edge(input_node=source, output_node=target)
+    elif _object_kind(flow) is _VALUES:
+        Edge(input_node=source, output_node=target, values=flow)
+    else:
+        Edge.from_object(flow)._set_endpoints(source, target)
+
+
 _deprecation_warning = (
     "Usage of {} is deprecated. Use oemof.network.Node instead."
 )
+_bus_deprecation_warning = _deprecation_warning.format("oemof.network.Bus")
+_component_deprecation_warning = _deprecation_warning.format(
+    "oemof.network.Component"
+)
 
 
 class Bus(Node):
+    __slots__ = []
+
     def __init__(self, *args, **kwargs):
-        warnings.warn(
-            _deprecation_warning.format("oemof.network.Bus"),
-            FutureWarning,
-        )
+        warnings.warn(_bus_deprecation_warning, FutureWarning)
         super().__init__(*args, **kwargs)
 
 
 class Component(Node):
+    __slots__ = []
+
     def __init__(self, *args, **kwargs):
-        warnings.warn(
-            _deprecation_warning.format("oemof.network.Component"),
-            FutureWarning,
-        )
+        warnings.warn(_component_deprecation_warning, FutureWarning)
         super().__init__(*args, **kwargs)
 
 
 class Sink(Component):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    __slots__ = []
 
 
 class Source(Component):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    __slots__ = []
 
 
 class Transformer(Component):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    __slots__ = []
@@ -13,7 +13,9 @@ SPDX-FileCopyrightText: Patrik Schönfeldt <patrik.schoenfeldt@dlr.de>
 SPDX-License-Identifier: MIT
 """
 
+import dill
 import pytest
+from oemof.tools.debugging import ExperimentalFeatureWarning
 
 from oemof.network.energy_system import EnergySystem
 from oemof.network.network import Edge
@@ -78,6 +80,100 @@ class TestsEnergySystem:
         assert (node1, node2) in self.es.flows().keys()
         assert (node2, node1) in self.es.flows().keys()
 
+    def test_flows_cache_is_invalidated(self):
+        node0 = Node(label="node0")
+        node1 = Node(label="node1", inputs={node0: Edge()})
+        self.es.add(node0, node1)
+
+        flows = self.es.flows()
+        assert (node0, node1) in flows
+        flows[node1, node0] = Edge()
+        assert (node1, node0) not in self.es.flows()
+
+        del node1.inputs[node0]
+        assert (node0, node1) not in self.es.flows()
+
+        node2 = Node(label="node2", inputs={node1: Edge()})
+        assert (node1, node2) in self.es.flows()
+
+        self.es.add(node2)
+        assert (node1, node2) in self.es.flows()
+
+    def test_caches_notice_nodes_removed_by_label(self):
+        node0 = Node(label="node0")
+        node1 = Node(label="node1", inputs=[node0])
+        self.es.add(node0, node1)
+        assert len(self.es.flows()) == 1
+        assert len(self.es.compile_adjacency().edges) == 1
+
+        with pytest.warns(ExperimentalFeatureWarning):
+            nodes = self.es.node
+        assert len(self.es.flows()) == 1
+        del nodes["node0"]
+        assert self.es.flows() == {}
+        assert len(self.es.compile_adjacency().nodes) == 1
+        assert len(self.es.compile_adjacency().edges) == 0
+
+    def test_compile_adjacency(self):
+        node0 = Node(label="node0")
+        node1 = Node(label="node1", inputs=[node0])
+        node2 = Node(label="node2", inputs=[node1, node0])
+        outside = Node(label="outside", inputs=[node2])
+        self.es.add(node0, node1, node2)
+
+        adjacency = self.es.compile_adjacency()
+        assert self.es.compile_adjacency() is adjacency
+        assert list(adjacency.nodes) == [node0, node1, node2]
+        assert list(adjacency.neighbors(0)) == [1, 2]
+        assert list(adjacency.neighbors(1)) == [2]
+        assert list(adjacency.neighbors(2)) == []
+        assert list(zip(adjacency.sources, adjacency.targets)) == [
+            (0, 1),
+            (0, 2),
+            (1, 2),
+        ]
+        assert list(adjacency.edges) == [
+            node0.outputs[node1],
+            node0.outputs[node2],
+            node1.outputs[node2],
+        ]
+
+        self.es.add(outside)
+        assert list(self.es.compile_adjacency().neighbors(2)) == [3]
+
+        del node0.outputs[node1]
+        assert list(self.es.compile_adjacency().neighbors(0)) == [2]
+
+    def test_dump_and_restore_keep_edges_intact(self, tmp_path):
+        node0 = Node(label="node0")
+        node1 = Node(label=("node", 1), inputs={node0: Edge(values=3)})
+        node2 = Node(label="node2", inputs=[node0, node1], outputs=[node0])
+        self.es.add(node0, node1, node2)
+        self.es.flows()
+        self.es.compile_adjacency()
+        self.es.dump(dpath=str(tmp_path))
+
+        with open(tmp_path / "es_dump.oemof", "rb") as f:
+            attributes = dill.load(f)
+        assert "_flows" not in attributes
+        assert "_adjacency" not in attributes
+
+        restored = EnergySystem()
+        restored.restore(dpath=str(tmp_path))
+        flows = {
+            (str(source), str(target)): edge.values
+            for (source, target), edge in restored.flows().items()
+        }
+        assert flows == {
+            ("node0", "('node', 1)"): 3,
+            ("node0", "node2"): None,
+            ("('node', 1)", "node2"): None,
+            ("node2", "node0"): None,
+        }
+        for node in restored.nodes:
+            for source in node.inputs:
+                assert node.inputs[source] is source.outputs[node]
+
     def test_that_node_additions_are_signalled(self):
         """
         When a node gets `add`ed, a corresponding signal should be emitted.
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -
+
+"""Tests of the graph module.
+
+This file is part of project oemof.network (github.com/oemof/oemof-network).
+
+SPDX-License-Identifier: MIT
+"""
+
+from oemof.network.energy_system import EnergySystem
+from oemof.network.graph import create_nx_graph
+from oemof.network.network import Edge
+from oemof.network.network import Node
+
+
+class WeightedEdge(Edge):
+    def __init__(self, nominal_value, **kwargs):
+        super().__init__(**kwargs)
+        self.nominal_value = nominal_value
+
+
+def test_nominal_values_become_edge_weights():
+    bus = Node(label="bus")
+    source = Node(label="source", outputs={bus: WeightedEdge(3)})
+    sink = Node(label="sink", inputs={bus: WeightedEdge(3)})
+    other = Node(label="other", inputs=[bus])
+    es = EnergySystem(nodes=[bus, source, sink, other])
+
+    graph = create_nx_graph(es)
+
+    assert graph.edges["source", "bus"]["weight"] == "3.00"
+    assert graph.edges["bus", "sink"]["weight"] == "3.00"
+    assert "weight" not in graph.edges["bus", "other"]
+
+    graph.edges["source", "bus"]["weight"] = "4.00"
+    assert graph.edges["bus", "sink"]["weight"] == "3.00"
@@ -138,11 +138,13 @@ def test_grouping_laziness():
     energy system is accessed.
     """
     group = "Group"
-    g = Entities(key=group, filter=lambda n: getattr(n, "group", False))
+    g = Entities(
+        key=group, filter=lambda n: n.custom_properties.get("group", False)
+    )
     ensys = es.EnergySystem(groupings=[g])
     buses = [Node("Grouped"), Node("Ungrouped one"), Node("Ungrouped two")]
     ensys.add(buses[0])
-    buses[0].group = True
+    buses[0].custom_properties["group"] = True
     ensys.add(*buses[1:])
     assert group in ensys.groups, (
         (
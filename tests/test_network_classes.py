@@ -252,6 +252,37 @@ class TestsNode:
         with pytest.raises(ValueError):
             Node("An entity with an input", inputs={"Not a Node": "A Flow"})
 
+    def test_failing_construction_does_not_connect_nodes(self):
+        n1 = Node("N1")
+        with pytest.raises(ValueError):
+            Node("N2", inputs=[n1, "Not a Node"])
+        assert not n1.outputs
+
+    def test_inputs_and_outputs_from_iterators(self):
+        n1 = Node("N1")
+        n2 = Node("N2", inputs=iter([n1]), outputs=(n for n in [n1]))
+        assert n2 in n1.outputs
+        assert n2 in n1.inputs
+
+    def test_flows_from_dict_like_objects(self):
+        class FlowTable:
+            """Provides flows via `get` without being a `Mapping`."""
+
+            def __init__(self, flows):
+                self.flows = flows
+
+            def __iter__(self):
+                return iter(self.flows)
+
+            def get(self, key, default=None):
+                return self.flows.get(key, default)
+
+        n1 = Node("N1")
+        n2 = Node("N2", inputs=FlowTable({n1: 7}))
+        n3 = Node("N3", outputs=FlowTable({n2: 5}))
+        assert n2.inputs[n1].values == 7
+        assert n3.outputs[n2].values == 5
+
     def test_node_requires_label(self):
         """
         A `Node` without `label` cannot be constructed.
@@ -316,6 +347,14 @@ class TestsEdge:
         assert edge.values == f
         assert edge.flow == f
 
+    def test_string_representation_follows_endpoints(self):
+        source, target = Node("source"), Node("target")
+        edge = Edge()
+        assert "None" in str(edge)
+        edge.input = source
+        edge.output = target
+        assert str(edge) == str(Edge.Label(source, target))
+
     def test_flow_setter(self):
         """`Edge.flow`'s setter relays to `values`."""
         e = Edge(values="initial values")
@@ -372,6 +411,30 @@ def test_custom_properties():
     assert node1.custom_properties[1] == 2
 
 
+def test_entities_use_slots():
+    with pytest.warns(FutureWarning):
+        nodes = [Bus("bus"), Sink("sink"), Source("source")]
+    for entity in nodes + [Entity("entity"), Node("node"), Edge()]:
+        assert not hasattr(entity, "__dict__")
+    assert not hasattr(Node("node").inputs, "__dict__")
+    with pytest.raises(AttributeError):
+        Node("node").undeclared_attribute = True
+
+
+def test_representation_names_the_class():
+    assert repr(Entity("entity")) == repr(
+        "<oemof.network.network.entity.Entity: 'entity'>"
+    )
+    assert repr(Node("node")) == repr(
+        "<oemof.network.network.nodes.Node: 'node'>"
+    )
+
+    class SubNode(Node):
+        __slots__ = []
+
+    assert repr(SubNode("sub")) == repr(f"<{__name__}.SubNode: 'sub'>")
+
+
 def test_comparision():
     node0 = Node(label=0)
     node1 = Node(label=2)
@@ -379,3 +442,7 @@ def test_comparision():
 
     assert node0 < node1
     assert node0 > node2
+    assert node0 <= node1
+    assert node0 >= node2
+    assert not node0 >= node1
+    assert sorted([node1, node2, node0]) == [node2, node0, node1]